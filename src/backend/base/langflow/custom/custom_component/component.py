@@ -1,10 +1,17 @@
+import asyncio
+import copy
+import hashlib
 import inspect
+import os
+import threading
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, List, Optional, Union, get_type_hints
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
-import nanoid  # type: ignore
 import yaml
+from cachetools import LRUCache
+from loguru import logger
 from pydantic import BaseModel
 
 from langflow.graph.state.model import create_state_model
@@ -12,7 +19,6 @@ from langflow.helpers.custom import format_type
 from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.schema.data import Data
 from langflow.schema.message import Message
-from langflow.services.tracing.schema import Log
 from langflow.template.field.base import UNDEFINED, Input, Output
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode
 from langflow.utils.async_helpers import run_until_complete
@@ -24,15 +30,103 @@ if TYPE_CHECKING:
     from langflow.graph.edge.schema import EdgeData
     from langflow.graph.vertex.base import Vertex
     from langflow.inputs.inputs import InputTypes
+    from langflow.services.tracing.schema import Log
 
-BACKWARDS_COMPATIBLE_ATTRIBUTES = ["user_id", "vertex", "tracing_service"]
+BACKWARDS_COMPATIBLE_ATTRIBUTES = frozenset({"user_id", "vertex", "tracing_service"})
+
+# Component ids use nanoid's url-safe alphabet. Random bytes are pulled in batches
+# and mapped onto the 64-character alphabet, which keeps the distribution uniform.
+_ID_ALPHABET = "_-0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_ID_TRANSLATION = bytes(ord(_ID_ALPHABET[byte & 63]) for byte in range(256))
+_ID_SIZE = 5
+_ID_BATCH_SIZE = 512
+_ID_POOL: list[str] = []
+# A forked worker must not hand out the ids its parent already buffered
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_ID_POOL.clear)
+
+
+def _refill_ids() -> str:
+    buffer = os.urandom(_ID_SIZE * _ID_BATCH_SIZE).translate(_ID_TRANSLATION).decode("ascii")
+    _ID_POOL.extend(buffer[i : i + _ID_SIZE] for i in range(_ID_SIZE, len(buffer), _ID_SIZE))
+    return buffer[:_ID_SIZE]
+
+
+def _generate_id() -> str:
+    # Another thread may take the last id between a check and the pop
+    try:
+        return _ID_POOL.pop()
+    except IndexError:
+        return _refill_ids()
+
+
+# Source of each component class's module, read once per class. Failed lookups
+# are stored as None so they are not retried on every instantiation.
+_CLASS_SOURCE_CACHE: "WeakKeyDictionary[type, Optional[str]]" = WeakKeyDictionary()
+
+
+def _get_class_source(cls: type) -> Optional[str]:
+    try:
+        return _CLASS_SOURCE_CACHE[cls]
+    except KeyError:
+        pass
+    source = None
+    module = inspect.getmodule(cls)
+    if module is not None:
+        try:
+            source = inspect.getsource(module)
+        except OSError:
+            source = None
+    _CLASS_SOURCE_CACHE[cls] = source
+    return source
+
+
+# Formatted return types of output methods, resolved once per (class, method name)
+_RETURN_TYPES_CACHE: "WeakKeyDictionary[type, dict[str, List[str]]]" = WeakKeyDictionary()
+
+# Whether each output method of a component class is a coroutine function
+_COROUTINE_METHODS_CACHE: "WeakKeyDictionary[type, dict[str, bool]]" = WeakKeyDictionary()
+
+# Results of cacheable components, keyed by a hash of their code and attributes
+_BUILD_CACHE: LRUCache = LRUCache(maxsize=1024)
+# LRUCache reorders entries on reads, so every access goes through this lock
+_BUILD_CACHE_LOCK = threading.Lock()
+# Only values of these exact types have a repr that fully identifies them
+_PLAIN_DATA_TYPES = (type(None), bool, int, float, str, bytes)
+
+
+def _is_plain_data(value: Any) -> bool:
+    if type(value) in _PLAIN_DATA_TYPES:
+        return True
+    if type(value) in (list, tuple, set, frozenset):
+        return all(_is_plain_data(item) for item in value)
+    if type(value) is dict:
+        return all(_is_plain_data(key) and _is_plain_data(item) for key, item in value.items())
+    return False
 
 
 class Component(CustomComponent):
     inputs: List["InputTypes"] = []
     outputs: List[Output] = []
     code_class_base_inheritance: ClassVar[str] = "Component"
-    _output_logs: dict[str, Log] = {}
+    cacheable: ClassVar[bool] = False
+    """Whether results can be reused across builds with the same code and attributes. Defaults to False."""
+    parallel_outputs: ClassVar[bool] = False
+    """Whether the output methods are independent and can run concurrently. Defaults to False."""
+    _output_logs: dict[str, "Log"] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve output return types once when the class is created. Hints that
+        # can't be resolved yet (e.g. forward references) are resolved lazily
+        # and raise when the component is instantiated.
+        for output in cls.outputs:
+            if not output.method:
+                continue
+            try:
+                cls._resolve_method_return_type(output.method)
+            except (NameError, KeyError, TypeError, AttributeError):
+                continue
 
     def __init__(self, **kwargs):
         # if key starts with _ it is a config
@@ -47,17 +141,20 @@ class Component(CustomComponent):
                 inputs[key] = value
         self._inputs: dict[str, "InputTypes"] = {}
         self._outputs: dict[str, Output] = {}
+        self._outputs_by_method: dict[str, Output] = {}
         self._results: dict[str, Any] = {}
         self._attributes: dict[str, Any] = {}
         self._parameters = inputs or {}
         self._edges: list[EdgeData] = []
         self._components: list[Component] = []
         self._state_model = None
+        # Tracks whether _attributes must be rebuilt from the inputs before the next run
+        self._attributes_dirty = True
         self.set_attributes(self._parameters)
         self._output_logs = {}
         config = config or {}
         if "_id" not in config:
-            config |= {"_id": f"{self.__class__.__name__}-{nanoid.generate(size=5)}"}
+            config |= {"_id": f"{self.__class__.__name__}-{_generate_id()}"}
         self.__inputs = inputs
         self.__config = config
         super().__init__(**config)
@@ -105,6 +202,7 @@ class Component(CustomComponent):
         new_component = type(self)(**kwargs)
         new_component._code = self._code
         new_component._outputs = self._outputs
+        new_component._outputs_by_method = self._outputs_by_method
         new_component._inputs = self._inputs
         new_component._edges = self._edges
         new_component._components = self._components
@@ -119,14 +217,10 @@ class Component(CustomComponent):
         # Get the source code of the calling class
         if self._code:
             return
-        try:
-            module = inspect.getmodule(self.__class__)
-            if module is None:
-                raise ValueError("Could not find module for class")
-            class_code = inspect.getsource(module)
-            self._code = class_code
-        except OSError:
+        class_code = _get_class_source(self.__class__)
+        if class_code is None:
             raise ValueError(f"Could not find source code for {self.__class__.__name__}")
+        self._code = class_code
 
     def set(self, **kwargs):
         """
@@ -143,6 +237,7 @@ class Component(CustomComponent):
         """
         for key, value in kwargs.items():
             self._process_connection_or_parameter(key, value)
+        self._attributes_dirty = True
         return self
 
     def list_inputs(self):
@@ -238,11 +333,21 @@ class Component(CustomComponent):
         Returns:
             None
         """
-        self.outputs = outputs
+        if outputs is not self.outputs:
+            self.outputs = outputs
+        if any(output.name is None for output in outputs):
+            raise ValueError("Output name cannot be None.")
+        self._outputs = {output.name: output for output in outputs}
+        self._outputs_by_method = self._index_outputs_by_method(outputs)
+
+    @staticmethod
+    def _index_outputs_by_method(outputs: List[Output]) -> dict[str, Output]:
+        # The first output using a method wins, as with a scan over the outputs
+        outputs_by_method: dict[str, Output] = {}
         for output in outputs:
-            if output.name is None:
-                raise ValueError("Output name cannot be None.")
-            self._outputs[output.name] = output
+            if output.method:
+                outputs_by_method.setdefault(output.method, output)
+        return outputs_by_method
 
     def map_inputs(self, inputs: List["InputTypes"]):
         """
@@ -255,11 +360,11 @@ class Component(CustomComponent):
             ValueError: If the input name is None.
 
         """
-        self.inputs = inputs
-        for input_ in inputs:
-            if input_.name is None:
-                raise ValueError("Input name cannot be None.")
-            self._inputs[input_.name] = input_
+        if inputs is not self.inputs:
+            self.inputs = inputs
+        if any(input_.name is None for input_ in inputs):
+            raise ValueError("Input name cannot be None.")
+        self._inputs = {input_.name: input_ for input_ in inputs}
 
     def validate(self, params: dict):
         """
@@ -284,11 +389,11 @@ class Component(CustomComponent):
     def get_output_by_method(self, method: Callable):
         # method is a callable and output.method is a string
         # we need to find the output that has the same method
-        output = next((output for output in self.outputs if output.method == method.__name__), None)
-        if output is None:
-            method_name = method.__name__ if hasattr(method, "__name__") else str(method)
+        method_name = method.__name__ if hasattr(method, "__name__") else str(method)
+        try:
+            return self._outputs_by_method[method_name]
+        except KeyError:
             raise ValueError(f"Output with method {method_name} not found")
-        return output
 
     def _inherits_from_component(self, method: Callable):
         # check if the method is a method from a class that inherits from Component
@@ -336,20 +441,22 @@ class Component(CustomComponent):
         self._add_edge(component, key, output, _input)
 
     def _add_edge(self, component, key, output, _input):
+        source_id = component._id
+        target_id = self._id
         self._edges.append(
             {
-                "source": component._id,
-                "target": self._id,
+                "source": source_id,
+                "target": target_id,
                 "data": {
                     "sourceHandle": {
                         "dataType": component.name or component.__class__.__name__,
-                        "id": component._id,
+                        "id": source_id,
                         "name": output.name,
                         "output_types": output.types,
                     },
                     "targetHandle": {
                         "fieldName": key,
-                        "id": self._id,
+                        "id": target_id,
                         "inputTypes": _input.input_types,
                         "type": _input.field_type,
                     },
@@ -375,22 +482,30 @@ class Component(CustomComponent):
                 if inspect.iscoroutine(result):
                     result = await result
                 self._inputs[key].value = result
+                self._attributes_dirty = True
 
-        self.set_attributes({})
+        if self._attributes_dirty:
+            self.set_attributes({})
+            self._attributes_dirty = False
 
         return await self.build_results()
 
     def __getattr__(self, name: str) -> Any:
-        if "_attributes" in self.__dict__ and name in self.__dict__["_attributes"]:
-            return self.__dict__["_attributes"][name]
-        if "_inputs" in self.__dict__ and name in self.__dict__["_inputs"]:
-            return self.__dict__["_inputs"][name].value
-        if "_outputs" in self.__dict__ and name in self.__dict__["_outputs"]:
-            return self.__dict__["_outputs"][name]
+        # Called on every attribute miss, so look each mapping up only once
+        instance_dict = object.__getattribute__(self, "__dict__")
+        attributes = instance_dict.get("_attributes")
+        if attributes is not None and name in attributes:
+            return attributes[name]
+        inputs = instance_dict.get("_inputs")
+        if inputs is not None and name in inputs:
+            return inputs[name].value
+        outputs = instance_dict.get("_outputs")
+        if outputs is not None and name in outputs:
+            return outputs[name]
         if name in BACKWARDS_COMPATIBLE_ATTRIBUTES:
-            return self.__dict__[f"_{name}"]
+            return instance_dict[f"_{name}"]
         if name.startswith("_") and name[1:] in BACKWARDS_COMPATIBLE_ATTRIBUTES:
-            return self.__dict__[name]
+            return instance_dict[name]
         raise AttributeError(f"{name} not found in {self.__class__.__name__}")
 
     def _set_input_value(self, name: str, value: Any):
@@ -403,6 +518,7 @@ class Component(CustomComponent):
             self._inputs[name].value = value
             if hasattr(self._inputs[name], "load_from_db"):
                 self._inputs[name].load_from_db = False
+            self._attributes_dirty = True
         else:
             raise ValueError(f"Input {name} not found in {self.__class__.__name__}")
 
@@ -410,12 +526,10 @@ class Component(CustomComponent):
         # Raise Error if some rule isn't met
         pass
 
-    def _map_parameters_on_frontend_node(self, frontend_node: ComponentFrontendNode):
-        for name, value in self._parameters.items():
-            frontend_node.set_field_value_in_template(name, value)
-
-    def _map_parameters_on_template(self, template: dict):
-        for name, value in self._parameters.items():
+    def _map_parameters_on_template(self, template: dict, parameters: Optional[dict] = None):
+        if parameters is None:
+            parameters = self._parameters
+        for name, value in parameters.items():
             try:
                 template[name]["value"] = value
             except KeyError:
@@ -426,11 +540,20 @@ class Component(CustomComponent):
                     )
                 raise ValueError(f"Parameter {name} not found in {self.__class__.__name__}. ")
 
+    @classmethod
+    def _resolve_method_return_type(cls, method_name: str) -> List[str]:
+        class_return_types = _RETURN_TYPES_CACHE.setdefault(cls, {})
+        if method_name not in class_return_types:
+            method = getattr(cls, method_name)
+            return_type = get_type_hints(method)["return"]
+            extracted_return_types = cls._extract_return_type(return_type)
+            class_return_types[method_name] = [
+                format_type(extracted_return_type) for extracted_return_type in extracted_return_types
+            ]
+        return class_return_types[method_name]
+
     def _get_method_return_type(self, method_name: str) -> List[str]:
-        method = getattr(self, method_name)
-        return_type = get_type_hints(method)["return"]
-        extracted_return_types = self._extract_return_type(return_type)
-        return [format_type(extracted_return_type) for extracted_return_type in extracted_return_types]
+        return list(self._resolve_method_return_type(method_name))
 
     def _update_template(self, frontend_node: dict):
         return frontend_node
@@ -441,11 +564,23 @@ class Component(CustomComponent):
         #! works and then update this later
         field_config = self.get_template_config(self)
         frontend_node = ComponentFrontendNode.from_inputs(**field_config)
-        self._map_parameters_on_frontend_node(frontend_node)
-
         frontend_node_dict = frontend_node.to_dict(keep_name=False)
+        # _update_template can read parameter values (e.g. the prompt template),
+        # so set the ones whose fields already exist before calling it
+        template = frontend_node_dict["template"]
+        for name, value in self._parameters.items():
+            if name in template:
+                template[name]["value"] = value
         frontend_node_dict = self._update_template(frontend_node_dict)
-        self._map_parameters_on_template(frontend_node_dict["template"])
+        # Only parameters without a field holding their value are left, e.g. fields
+        # _update_template added. Unknown names still raise here.
+        template = frontend_node_dict["template"]
+        remaining_parameters = {
+            name: value
+            for name, value in self._parameters.items()
+            if name not in template or template[name].get("value") is not value
+        }
+        self._map_parameters_on_template(template, remaining_parameters)
 
         frontend_node = ComponentFrontendNode.from_dict(frontend_node_dict)
         if not self._code:
@@ -483,10 +618,13 @@ class Component(CustomComponent):
 
     def _validate_inputs(self, params: dict):
         # Params keys are the `name` attribute of the Input objects
-        for key, value in params.copy().items():
+        for key, value in list(params.items()):
             if key not in self._inputs:
                 continue
             input_ = self._inputs[key]
+            # The value is already assigned, so there is nothing to validate again
+            if input_.value is value:
+                continue
             # BaseInputMixin has a `validate_assignment=True`
 
             input_.value = value
@@ -494,17 +632,16 @@ class Component(CustomComponent):
 
     def set_attributes(self, params: dict):
         self._validate_inputs(params)
-        _attributes = {}
+        self_dict = self.__dict__
         for key, value in params.items():
-            if key in self.__dict__ and value != getattr(self, key):
+            if key in self_dict and value != self_dict[key]:
                 raise ValueError(
                     f"{self.__class__.__name__} defines an input parameter named '{key}' "
                     f"that is a reserved word and cannot be used."
                 )
-            _attributes[key] = value
+        _attributes = dict(params)
         for key, input_obj in self._inputs.items():
-            if key not in _attributes:
-                _attributes[key] = input_obj.value or None
+            _attributes.setdefault(key, input_obj.value or None)
         self._attributes = _attributes
 
     def _set_outputs(self, outputs: List[dict]):
@@ -512,6 +649,7 @@ class Component(CustomComponent):
         for output in self.outputs:
             setattr(self, output.name, output)
             self._outputs[output.name] = output
+        self._outputs_by_method = self._index_outputs_by_method(self.outputs)
 
     def get_trace_as_inputs(self):
         predefined_inputs = {
@@ -547,69 +685,135 @@ class Component(CustomComponent):
             return await self._build_with_tracing()
         return await self._build_without_tracing()
 
+    def _is_coroutine_method(self, method_name: str, method: Callable) -> bool:
+        class_methods = _COROUTINE_METHODS_CACHE.setdefault(self.__class__, {})
+        is_coroutine = class_methods.get(method_name)
+        if is_coroutine is None:
+            is_coroutine = class_methods[method_name] = inspect.iscoroutinefunction(method)
+        return is_coroutine
+
+    def _build_artifact(self, result: Any) -> dict:
+        custom_repr = self.custom_repr()
+        if custom_repr is None and isinstance(result, (dict, Data, str)):
+            custom_repr = result
+        if not isinstance(custom_repr, str):
+            custom_repr = str(custom_repr)
+        raw = result
+        if self.status is None:
+            artifact_value = raw
+        else:
+            artifact_value = self.status
+            raw = self.status
+
+        if hasattr(raw, "data") and raw is not None:
+            raw = raw.data
+        if raw is None:
+            raw = custom_repr
+
+        elif hasattr(raw, "model_dump") and raw is not None:
+            raw = raw.model_dump()
+        if raw is None and isinstance(result, (dict, Data, str)):
+            raw = result.data if isinstance(result, Data) else result
+        artifact_type = get_artifact_type(artifact_value, result)
+        raw, artifact_type = post_process_raw(raw, artifact_type)
+        return {"repr": custom_repr, "raw": raw, "type": artifact_type}
+
+    def _get_outputs_to_build(self) -> List[Output]:
+        # Build the output if it's connected to some other vertex
+        # or if it's not connected to any vertex
+        if not hasattr(self, "outputs"):
+            return []
+        if not self._vertex or not self._vertex.outgoing_edges:
+            return list(self.outputs)
+        return [output for output in self.outputs if output.name in self._vertex.edges_source_names]
+
+    def _get_build_cache_key(self) -> Optional[bytes]:
+        # Objects with default, truncated or masked reprs could collide with other
+        # inputs, so those builds are not cached
+        if not all(_is_plain_data(value) for value in self._attributes.values()):
+            return None
+        # Only outputs that will actually be built are part of the result
+        built_outputs = [output.name for output in self._get_outputs_to_build()]
+        flow_id = self._vertex.graph.flow_id if self._vertex is not None else None
+        key_source = repr(
+            (
+                self.__class__.__qualname__,
+                sorted(self._attributes.items()),
+                built_outputs,
+                flow_id,
+                self._user_id,
+            )
+        )
+        return hashlib.blake2b(key_source.encode() + (self._code or "").encode()).digest()
+
+    async def _build_output(self, output: Output) -> Any:
+        if output.method is None:
+            raise ValueError(f"Output {output.name} does not have a method defined.")
+        method: Callable = getattr(self, output.method)
+        if output.cache and output.value is not UNDEFINED:
+            return output.value
+        result = method()
+        # If the method is asynchronous, we need to await it
+        if self._is_coroutine_method(output.method, method):
+            result = await result
+        if (
+            self._vertex is not None
+            and isinstance(result, Message)
+            and result.flow_id is None
+            and self._vertex.graph.flow_id is not None
+        ):
+            result.set_flow_id(self._vertex.graph.flow_id)
+        output.value = result
+        return result
+
     async def _build_results(self):
+        cache_key = None
+        if self.cacheable:
+            cache_key = self._get_build_cache_key()
+            cached = None
+            if cache_key is not None:
+                with _BUILD_CACHE_LOCK:
+                    cached = _BUILD_CACHE.get(cache_key)
+            if cached is not None:
+                # Copy so callers can't change what later hits receive
+                _results, _artifacts, self.status, output_logs = deepcopy(cached)
+                for name, result in _results.items():
+                    self._outputs[name].value = result
+                self._output_logs.update(output_logs)
+                self._artifacts = _artifacts
+                self._results = _results
+                return _results, _artifacts
         _results = {}
         _artifacts = {}
-        if hasattr(self, "outputs"):
-            for output in self.outputs:
-                # Build the output if it's connected to some other vertex
-                # or if it's not connected to any vertex
-                if (
-                    not self._vertex
-                    or not self._vertex.outgoing_edges
-                    or output.name in self._vertex.edges_source_names
-                ):
-                    if output.method is None:
-                        raise ValueError(f"Output {output.name} does not have a method defined.")
-                    method: Callable = getattr(self, output.method)
-                    if output.cache and output.value != UNDEFINED:
-                        _results[output.name] = output.value
-                        result = output.value
-                    else:
-                        result = method()
-                        # If the method is asynchronous, we need to await it
-                        if inspect.iscoroutinefunction(method):
-                            result = await result
-                        if (
-                            self._vertex is not None
-                            and isinstance(result, Message)
-                            and result.flow_id is None
-                            and self._vertex.graph.flow_id is not None
-                        ):
-                            result.set_flow_id(self._vertex.graph.flow_id)
-                        _results[output.name] = result
-                        output.value = result
-                    custom_repr = self.custom_repr()
-                    if custom_repr is None and isinstance(result, (dict, Data, str)):
-                        custom_repr = result
-                    if not isinstance(custom_repr, str):
-                        custom_repr = str(custom_repr)
-                    raw = result
-                    if self.status is None:
-                        artifact_value = raw
-                    else:
-                        artifact_value = self.status
-                        raw = self.status
-
-                    if hasattr(raw, "data") and raw is not None:
-                        raw = raw.data
-                    if raw is None:
-                        raw = custom_repr
-
-                    elif hasattr(raw, "model_dump") and raw is not None:
-                        raw = raw.model_dump()
-                    if raw is None and isinstance(result, (dict, Data, str)):
-                        raw = result.data if isinstance(result, Data) else result
-                    artifact_type = get_artifact_type(artifact_value, result)
-                    raw, artifact_type = post_process_raw(raw, artifact_type)
-                    artifact = {"repr": custom_repr, "raw": raw, "type": artifact_type}
-                    _artifacts[output.name] = artifact
-                    self._output_logs[output.name] = self._logs
-                    self._logs = []
+        outputs = self._get_outputs_to_build()
+        if self.parallel_outputs:
+            # Status and logs are shared by the concurrent methods, so every
+            # artifact sees the final status and the logs of the whole build
+            results = await asyncio.gather(*(self._build_output(output) for output in outputs))
+            for output, result in zip(outputs, results):
+                _results[output.name] = result
+                _artifacts[output.name] = self._build_artifact(result)
+                self._output_logs[output.name] = self._logs
+            self._logs = []
+        else:
+            for output in outputs:
+                result = await self._build_output(output)
+                _results[output.name] = result
+                _artifacts[output.name] = self._build_artifact(result)
+                self._output_logs[output.name] = self._logs
+                self._logs = []
         self._artifacts = _artifacts
         self._results = _results
-        if self._tracing_service:
-            self._tracing_service.set_outputs(self.trace_name, _results)
+        if cache_key is not None:
+            output_logs = {name: self._output_logs[name] for name in _results}
+            try:
+                cached = deepcopy((_results, _artifacts, self.status, output_logs))
+            except (TypeError, copy.Error, RecursionError) as exc:
+                # Results that can't be copied are not cached
+                logger.debug(f"Not caching results of {self.__class__.__name__}: {exc}")
+            else:
+                with _BUILD_CACHE_LOCK:
+                    _BUILD_CACHE[cache_key] = cached
         return _results, _artifacts
 
     def custom_repr(self):
@@ -364,7 +364,8 @@ class CustomComponent(BaseComponent):
         """
         return self.get_method_return_type(self._function_entrypoint_name)
 
-    def _extract_return_type(self, return_type: Any) -> List[Any]:
+    @staticmethod
+    def _extract_return_type(return_type: Any) -> List[Any]:
         if hasattr(return_type, "__origin__") and return_type.__origin__ in [
             list,
             List,
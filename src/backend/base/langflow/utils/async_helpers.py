@@ -1,18 +1,64 @@
 import asyncio
 import threading
+import weakref
+
+_thread_local = threading.local()
+
+
+def _close_loop(loop):
+    if not loop.is_closed():
+        loop.close()
+
+
+def _get_thread_event_loop():
+    # Reuse one event loop per thread instead of creating a new one for every call
+    loop = getattr(_thread_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_local.loop = loop
+        # Close the loop, and its default executor, once the thread is gone
+        weakref.finalize(threading.current_thread(), _close_loop, loop)
+    return loop
+
+
+def _cancel_pending_tasks(loop):
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def _run_in_thread_event_loop(coro):
+    # Same cleanup as asyncio.run, except that the loop and its default executor
+    # are kept for the next call on this thread
+    loop = _get_thread_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            _cancel_pending_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        except BaseException:
+            # Don't reuse a loop whose cleanup failed
+            _thread_local.loop = None
+            _close_loop(loop)
+            raise
 
 
 def run_until_complete(coro):
     try:
         loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # Run the coroutine in a separate event loop in a new thread
-            return run_in_thread(coro)
-        else:
-            return loop.run_until_complete(coro)
     except RuntimeError:
-        # If there's no event loop, create a new one and run the coroutine
-        return asyncio.run(coro)
+        loop = None
+    if loop is None or loop.is_closed():
+        # If there's no usable event loop, run the coroutine in this thread's cached loop
+        return _run_in_thread_event_loop(coro)
+    if loop.is_running():
+        # Run the coroutine in a separate event loop in a new thread
+        return run_in_thread(coro)
+    return loop.run_until_complete(coro)
 
 
 def run_in_thread(coro):
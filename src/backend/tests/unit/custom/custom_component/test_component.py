@@ -1,7 +1,19 @@
+import asyncio
+
 import pytest
 
 from langflow.components.inputs.ChatInput import ChatInput
 from langflow.components.outputs import ChatOutput
+from langflow.custom import Component
+from langflow.custom.custom_component.component import (
+    _BUILD_CACHE,
+    _ID_ALPHABET,
+    _ID_BATCH_SIZE,
+    _ID_POOL,
+    _ID_SIZE,
+    _generate_id,
+)
+from langflow.io import MessageTextInput, Output, SecretStrInput
 
 
 @pytest.fixture
@@ -9,8 +21,124 @@ def client():
     pass
 
 
+@pytest.fixture
+def build_cache():
+    _BUILD_CACHE.clear()
+    yield _BUILD_CACHE
+    _BUILD_CACHE.clear()
+
+
+def test_generate_id_refills_empty_pool():
+    _ID_POOL.clear()
+    component_id = _generate_id()
+    assert len(component_id) == _ID_SIZE
+    assert set(component_id) <= set(_ID_ALPHABET)
+    assert len(_ID_POOL) == _ID_BATCH_SIZE - 1
+    assert all(len(pooled_id) == _ID_SIZE and set(pooled_id) <= set(_ID_ALPHABET) for pooled_id in _ID_POOL)
+
+    pooled_id = _ID_POOL[-1]
+    assert _generate_id() == pooled_id
+    assert len(_ID_POOL) == _ID_BATCH_SIZE - 2
+
+
 def test_set_invalid_output():
     chatinput = ChatInput()
     chatoutput = ChatOutput()
     with pytest.raises(ValueError):
         chatoutput.set(input_value=chatinput.build_config)
+
+
+@pytest.mark.asyncio
+async def test_cacheable_component_reuses_results(build_cache):
+    calls = []
+
+    class EchoComponent(Component):
+        cacheable = True
+        inputs = [MessageTextInput(name="text")]
+        outputs = [Output(display_name="Echo", name="echo", method="build_echo")]
+
+        def build_echo(self) -> str:
+            calls.append(self.text)
+            return self.text
+
+    first = await EchoComponent().set(text="hello").run()
+    second = await EchoComponent().set(text="hello").run()
+    assert first == second
+    assert calls == ["hello"]
+
+    await EchoComponent().set(text="bye").run()
+    assert calls == ["hello", "bye"]
+
+
+@pytest.mark.asyncio
+async def test_parallel_outputs_run_concurrently():
+    both_started = asyncio.Event()
+    started = []
+
+    class PairComponent(Component):
+        parallel_outputs = True
+        outputs = [
+            Output(display_name="First", name="first", method="build_first"),
+            Output(display_name="Second", name="second", method="build_second"),
+        ]
+
+        async def _wait_for_both(self, name: str) -> str:
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return name
+
+        async def build_first(self) -> str:
+            return await self._wait_for_both("first")
+
+        async def build_second(self) -> str:
+            return await self._wait_for_both("second")
+
+    results, _ = await PairComponent().run()
+    assert results == {"first": "first", "second": "second"}
+
+
+def test_get_output_by_method_uses_first_output():
+    class SharedMethodComponent(Component):
+        outputs = [
+            Output(display_name="First", name="first", method="build_value"),
+            Output(display_name="Second", name="second", method="build_value"),
+            Output(display_name="Other", name="other", method="build_other"),
+        ]
+
+        def build_value(self) -> str:
+            return "value"
+
+        def build_other(self) -> str:
+            return "other"
+
+    component = SharedMethodComponent()
+    assert component.get_output_by_method(component.build_value).name == "first"
+
+    component._set_outputs([{"display_name": "First", "name": "first", "method": "build_value"}])
+    with pytest.raises(ValueError):
+        component.get_output_by_method(component.build_other)
+
+
+def test_to_frontend_node_reflects_each_instance():
+    class KeyedComponent(Component):
+        inputs = [
+            MessageTextInput(name="text"),
+            SecretStrInput(name="api_key"),
+        ]
+        outputs = [Output(display_name="Text", name="out", method="build_out")]
+
+        def build_out(self) -> str:
+            return self.text
+
+    first = KeyedComponent().set(text="first")
+    first_template = first.to_frontend_node()["data"]["node"]["template"]
+    assert first_template["text"]["value"] == "first"
+    assert first_template["api_key"]["load_from_db"] is True
+
+    second = KeyedComponent().set(text="second", api_key="sk-test")
+    second_template = second.to_frontend_node()["data"]["node"]["template"]
+    assert second_template["text"]["value"] == "second"
+    assert second_template["api_key"]["value"] == "sk-test"
+    assert second_template["api_key"]["load_from_db"] is False
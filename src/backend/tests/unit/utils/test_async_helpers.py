@@ -0,0 +1,80 @@
+import asyncio
+import threading
+
+import pytest
+from langflow.utils.async_helpers import run_until_complete
+
+
+@pytest.fixture
+def client():
+    pass
+
+
+def run_in_worker_thread(func):
+    result = {}
+
+    def target():
+        try:
+            result["value"] = func()
+        except BaseException as exc:
+            result["error"] = exc
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+async def get_running_loop():
+    return asyncio.get_running_loop()
+
+
+def test_run_until_complete_reuses_loop_in_worker_thread():
+    def calls():
+        first_loop = run_until_complete(get_running_loop())
+        second_loop = run_until_complete(get_running_loop())
+        return first_loop, second_loop, first_loop.is_closed()
+
+    first_loop, second_loop, closed_between_calls = run_in_worker_thread(calls)
+    assert first_loop is second_loop
+    assert not closed_between_calls
+
+
+def test_run_until_complete_cancels_pending_tasks_between_calls():
+    events = []
+
+    async def leave_pending_task():
+        async def pending():
+            try:
+                await asyncio.sleep(10)
+                events.append("resumed")
+            except asyncio.CancelledError:
+                events.append("cancelled")
+                raise
+
+        asyncio.get_running_loop().create_task(pending())
+        await asyncio.sleep(0)
+
+    async def pending_tasks():
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    def calls():
+        run_until_complete(leave_pending_task())
+        return run_until_complete(pending_tasks())
+
+    assert run_in_worker_thread(calls) == []
+    assert events == ["cancelled"]
+
+
+def test_run_until_complete_propagates_runtime_error_without_rerun():
+    runs = []
+
+    async def fail():
+        runs.append(1)
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_in_worker_thread(lambda: run_until_complete(fail()))
+    assert runs == [1]